@@ -1,23 +1,51 @@
 """
 Page Object Model for SauceDemo Shopping Cart Page.
 """
+from functools import cached_property
+from weakref import WeakKeyDictionary
+
 from playwright.sync_api import Page, Locator
 
+# One CartPage per Playwright page; entries vanish when the page is GC'd
+_instances: "WeakKeyDictionary[Page, CartPage]" = WeakKeyDictionary()
+
 
 class CartPage:
     """Represents the SauceDemo shopping cart page."""
-    
+
+    @classmethod
+    def for_page(cls, page: Page) -> "CartPage":
+        """
+        Return the cached CartPage for this page, creating it on first use.
+        """
+        instance = _instances.get(page)
+        if instance is None:
+            instance = _instances[page] = cls(page)
+        return instance
+
     def __init__(self, page: Page):
         """
         Initialize CartPage with a Playwright page object.
-        
+
+        Locators are built lazily (and then cached) so constructing the
+        page object costs nothing until a locator is actually used.
+
         Args:
             page: Playwright Page instance
         """
         self.page = page
-        self.cart_items = page.locator('.cart_item')
-        self.continue_shopping_button = page.get_by_role("button", name="Continue Shopping")
-        self.checkout_button = page.get_by_role("button", name="Checkout")
+
+    @cached_property
+    def cart_items(self) -> Locator:
+        return self.page.locator('.cart_item')
+
+    @cached_property
+    def continue_shopping_button(self) -> Locator:
+        return self.page.locator('[data-test="continue-shopping"]')
+
+    @cached_property
+    def checkout_button(self) -> Locator:
+        return self.page.locator('[data-test="checkout"]')
     
     def is_loaded(self) -> bool:
         """
@@ -26,7 +54,13 @@ class CartPage:
         Returns:
             True if cart page elements are visible
         """
-        return self.checkout_button.is_visible() or self.continue_shopping_button.is_visible()
+        # OR both visibilities in one evaluate instead of two is_visible() calls
+        return self.page.evaluate(
+            """() => ['checkout', 'continue-shopping'].some(key => {
+                const el = document.querySelector(`[data-test="${key}"]`);
+                return el && el.offsetParent !== null;
+            })"""
+        )
     
     def get_items(self) -> list[dict]:
         """
@@ -35,22 +69,15 @@ class CartPage:
         Returns:
             List of dictionaries containing item information
         """
-        # Wait for cart items to be visible before reading them
-        # This ensures items are fully rendered before we try to read their content
-        if self.cart_items.count() > 0:
-            self.cart_items.first.wait_for(state="visible")
-        
-        items = []
-        for item in self.cart_items.all():
-            name = item.locator('.inventory_item_name').inner_text()
-            price = item.locator('.inventory_item_price').inner_text()
-            quantity = item.locator('.cart_quantity').inner_text()
-            items.append({
-                'name': name,
-                'price': price,
-                'quantity': quantity
-            })
-        return items
+        # Read all fields of all items in a single round-trip to the browser
+        # instead of one inner_text() call per field per item
+        return self.cart_items.evaluate_all(
+            """items => items.map(item => ({
+                name: item.querySelector('.inventory_item_name').innerText,
+                price: item.querySelector('.inventory_item_price').innerText,
+                quantity: item.querySelector('.cart_quantity').innerText,
+            }))"""
+        )
     
     def remove_item(self, item_name: str) -> None:
         """
@@ -1,12 +1,50 @@
 """
 Page Object Model for SauceDemo Inventory/Products Page.
 """
+import re
+from functools import lru_cache
+from weakref import WeakKeyDictionary
+
 from playwright.sync_api import Page, Locator, expect
 
+# One InventoryPage per Playwright page; entries vanish when the page is GC'd
+_instances: "WeakKeyDictionary[Page, InventoryPage]" = WeakKeyDictionary()
+
+
+@lru_cache(maxsize=128)
+def _slug(item_name: str) -> str:
+    """
+    Convert a product name to the slug SauceDemo uses in its data-test
+    attributes (e.g. 'Sauce Labs Backpack' -> 'sauce-labs-backpack').
+
+    The app only lowercases and hyphenates whitespace; punctuation is kept
+    ('Test.allTheThings() T-Shirt (Red)' -> 'test.allthethings()-t-shirt-(red)').
+
+    Args:
+        item_name: Display name of the product
+
+    Returns:
+        Slugified product name
+    """
+    return re.sub(r'\s+', '-', item_name.lower())
+
 
 class InventoryPage:
     """Represents the SauceDemo inventory/products page."""
-    
+
+    @classmethod
+    def for_page(cls, page: Page) -> "InventoryPage":
+        """
+        Return the cached InventoryPage for this page, creating it on first use.
+
+        Reusing the instance keeps the parsed locators (and the per-item
+        locator cache) alive across fixtures/tests that share a page.
+        """
+        instance = _instances.get(page)
+        if instance is None:
+            instance = _instances[page] = cls(page)
+        return instance
+
     def __init__(self, page: Page):
         """
         Initialize InventoryPage with a Playwright page object.
@@ -23,6 +61,25 @@ class InventoryPage:
         self.product_desc_elements = page.locator(".inventory_item_desc")
         self.menu_button = page.locator("#react-burger-menu-btn")
         self.logout_link = page.locator("#logout_sidebar_link")
+        # Locators are lazy handles bound to this page, so the filtered
+        # container for a given item can be built once and reused instead of
+        # re-parsing the selector chain on every add/remove call
+        self._item_locator_cache: dict[str, Locator] = {}
+
+    def _item_container(self, item_name: str) -> Locator:
+        """
+        Return the (cached) locator for a product's inventory item container.
+
+        Args:
+            item_name: Name of the product
+
+        Returns:
+            Locator for the matching .inventory_item container
+        """
+        return self._item_locator_cache.setdefault(
+            item_name,
+            self.page.locator(".inventory_item").filter(has_text=item_name),
+        )
     
     def is_loaded(self) -> bool:
         """
@@ -40,11 +97,10 @@ class InventoryPage:
         Args:
             item_name: Name of the product to add
         """
-        # Find the product item container
-        item = self.page.locator(".inventory_item").filter(has_text=item_name)
-        # Click the "Add to cart" button for this item
-        add_button = item.locator('button').filter(has_text='Add to cart')
-        add_button.click()
+        # SauceDemo exposes deterministic data-test attributes on the buttons,
+        # so the click resolves via one direct attribute selector instead of
+        # enumerating and text-matching buttons inside the item container
+        self.page.locator(f'[data-test="add-to-cart-{_slug(item_name)}"]').click()
     
     def remove_item_from_cart(self, item_name: str) -> None:
         """
@@ -53,9 +109,7 @@ class InventoryPage:
         Args:
             item_name: Name of the product to remove
         """
-        item = self.page.locator(".inventory_item").filter(has_text=item_name)
-        remove_button = item.locator("button").filter(has_text="Remove")
-        remove_button.click()
+        self.page.locator(f'[data-test="remove-{_slug(item_name)}"]').click()
     
     def get_cart_count(self) -> int:
         """
@@ -64,13 +118,36 @@ class InventoryPage:
         Returns:
             Number of items in cart, 0 if badge is not visible
         """
-        cart_badge = self.page.locator(".shopping_cart_badge")
-        if cart_badge.count() == 0:
-            return 0
-        if cart_badge.is_visible(timeout=0):
-            return int(cart_badge.inner_text())
-        return 0
+        # Single evaluate instead of separate count() + is_visible() +
+        # inner_text() round-trips; the badge lives inside the cart link
+        return self.cart_icon.evaluate(
+            """el => {
+                const badge = el.querySelector('.shopping_cart_badge');
+                return badge ? parseInt(badge.innerText, 10) : 0;
+            }"""
+        )
     
+    def get_cart_snapshot(self) -> dict:
+        """
+        Capture several page facts in a single round-trip.
+
+        Useful when a test asserts multiple things at once (badge count,
+        page readiness, current URL) - one evaluate instead of one call
+        per fact.
+
+        Returns:
+            Dict with 'count' (badge count, 0 when absent), 'loaded'
+            (whether the product list is rendered) and 'url'.
+        """
+        return self.page.evaluate(
+            """() => ({
+                count: parseInt(
+                    document.querySelector('.shopping_cart_badge')?.innerText ?? '0', 10),
+                loaded: document.querySelector('.inventory_item') !== null,
+                url: location.href,
+            })"""
+        )
+
     def sort_by(self, option: str) -> None:
         """
         Sort products by the given option.
@@ -82,6 +159,35 @@ class InventoryPage:
         self.sort_dropdown.wait_for(state="attached")
         self.sort_dropdown.select_option(option)
     
+    def seed_cart(self, item_names: list[str]) -> None:
+        """
+        Seed the cart directly through localStorage instead of clicking.
+
+        SauceDemo keeps the cart as a JSON array of product ids in
+        localStorage['cart-contents']; the ids are resolved from the
+        rendered inventory inside the same evaluate, then one light reload
+        picks the state up. Use this for tests that only assert end state;
+        tests covering the add/remove click handlers should keep clicking
+        the real buttons.
+
+        Args:
+            item_names: Names of the products to place in the cart
+        """
+        self.page.evaluate(
+            """names => {
+                const ids = [];
+                document.querySelectorAll('.inventory_item_label a').forEach(link => {
+                    const name = link.querySelector('.inventory_item_name').innerText;
+                    if (names.includes(name)) {
+                        ids.push(parseInt(link.id.split('_')[1], 10));
+                    }
+                });
+                localStorage.setItem('cart-contents', JSON.stringify(ids));
+            }""",
+            item_names,
+        )
+        self.page.reload(wait_until="domcontentloaded")
+
     def open_cart(self) -> None:
         """Click on the cart icon to navigate to cart page."""
         self.cart_icon.click()
@@ -93,7 +199,10 @@ class InventoryPage:
         Returns:
             List of product names
         """
-        return [name.inner_text() for name in self.product_name_elements.all()]
+        # One round-trip for all names instead of one inner_text() per element
+        return self.product_name_elements.evaluate_all(
+            "els => els.map(el => el.innerText)"
+        )
 
     def get_products(self) -> list[dict]:
         """
@@ -102,19 +211,14 @@ class InventoryPage:
         Returns:
             List of dictionaries containing product name, description and price.
         """
-        products: list[dict] = []
-        for item in self.product_items.all():
-            name = item.locator(".inventory_item_name").inner_text()
-            description = item.locator(".inventory_item_desc").inner_text()
-            price = item.locator(".inventory_item_price").inner_text()
-            products.append(
-                {
-                    "name": name,
-                    "description": description,
-                    "price": price,
-                }
-            )
-        return products
+        # Single evaluate_all round-trip instead of three reads per item
+        return self.product_items.evaluate_all(
+            """items => items.map(item => ({
+                name: item.querySelector('.inventory_item_name').innerText,
+                description: item.querySelector('.inventory_item_desc').innerText,
+                price: item.querySelector('.inventory_item_price').innerText,
+            }))"""
+        )
 
     def get_product_prices(self) -> list[float]:
         """
@@ -123,14 +227,13 @@ class InventoryPage:
         Returns:
             List of product prices.
         """
-        prices: list[float] = []
-        for price_el in self.product_price_elements.all():
-            text = price_el.inner_text().strip().replace("$", "")
-            try:
-                prices.append(float(text))
-            except ValueError:
-                continue
-        return prices
+        # Parse in the browser and return floats in one round-trip instead
+        # of one inner_text() call per price element
+        return self.product_price_elements.evaluate_all(
+            """els => els
+                .map(el => parseFloat(el.innerText.replace('$', '')))
+                .filter(price => !isNaN(price))"""
+        )
 
     def open_product_details(self, item_name: str) -> None:
         """
@@ -139,11 +242,11 @@ class InventoryPage:
         Args:
             item_name: Name of the product whose details page should be opened.
         """
-        item = self.page.locator(".inventory_item").filter(has_text=item_name)
-        item.locator(".inventory_item_name").click()
+        self._item_container(item_name).locator(".inventory_item_name").click()
     
     def logout(self) -> None:
         """Logout from the application."""
         self.menu_button.click()
-        self.logout_link.wait_for(state="visible")
+        # click() auto-waits for the link to become actionable, which covers
+        # the menu slide-in animation without an explicit wait_for
         self.logout_link.click()
@@ -1,13 +1,31 @@
 """
 Page Object Model for SauceDemo Login Page.
 """
+from weakref import WeakKeyDictionary
+
 from playwright.sync_api import Page
 from utils.config import BASE_URL
 
+# One LoginPage per Playwright page; entries vanish when the page is GC'd
+_instances: "WeakKeyDictionary[Page, LoginPage]" = WeakKeyDictionary()
+
 
 class LoginPage:
     """Represents the SauceDemo login page."""
-    
+
+    @classmethod
+    def for_page(cls, page: Page) -> "LoginPage":
+        """
+        Return the cached LoginPage for this page, creating it on first use.
+
+        Reusing the instance avoids re-running the locator setup in
+        __init__ when several fixtures/tests wrap the same page.
+        """
+        instance = _instances.get(page)
+        if instance is None:
+            instance = _instances[page] = cls(page)
+        return instance
+
     def __init__(self, page: Page):
         """
         Initialize LoginPage with a Playwright page object.
@@ -18,7 +36,9 @@ class LoginPage:
         self.page = page
         self.username_input = page.get_by_placeholder("Username")
         self.password_input = page.get_by_placeholder("Password")
-        self.login_button = page.get_by_role("button", name="Login")
+        # data-test selectors resolve via native querySelector, avoiding the
+        # slower role-engine scan of every element on the page
+        self.login_button = page.locator('[data-test="login-button"]')
         self.error_message = page.locator('[data-test="error"]')
         # Error UI elements
         self.error_icon = page.locator(".error_icon")
@@ -47,9 +67,14 @@ class LoginPage:
         Returns:
             Error message text, empty string if not present
         """
-        if self.error_message.is_visible():
-            return self.error_message.inner_text()
-        return ""
+        # One evaluate covers both the visibility check and the text read;
+        # offsetParent is null for hidden/absent elements
+        return self.page.evaluate(
+            """() => {
+                const error = document.querySelector('[data-test="error"]');
+                return (error && error.offsetParent !== null) ? error.innerText : '';
+            }"""
+        )
 
     def dismiss_error(self) -> None:
         """
@@ -1,29 +1,135 @@
 """
 Pytest configuration and fixtures for Playwright tests.
 """
+import json
+import os
+from urllib.parse import urlsplit
+
 import pytest
-from playwright.sync_api import Page, expect
-from utils.config import BASE_URL, STANDARD_USER, STANDARD_PASSWORD
+from playwright.sync_api import Browser, BrowserContext, Page
+from utils.config import (
+    BASE_URL,
+    DEFAULT_TIMEOUT,
+    NAVIGATION_TIMEOUT,
+    STANDARD_USER,
+    STANDARD_PASSWORD,
+)
 from pages.login_page import LoginPage
 from pages.inventory_page import InventoryPage
+from pages.checkout_page import CheckoutPage
+from utils.helpers import load_test_data
 
 BASE_URL_NO_SLASH = BASE_URL.rstrip("/")
 
 
 @pytest.fixture(scope="session")
-def browser_context_args(browser_context_args):
-    """Configure browser context arguments."""
-    return {
+def test_data() -> dict:
+    """
+    Test data parsed once per session (per xdist worker).
+
+    Tests take this as a parameter instead of calling load_test_data()
+    at the top of every test body.
+    """
+    return load_test_data()
+
+
+@pytest.fixture(scope="session")
+def browser_context_args(browser_context_args, worker_id):
+    """
+    Configure browser context arguments.
+
+    Video recording forces the browser to encode and flush every frame,
+    so it is only enabled when explicitly requested for failure triage:
+    PW_RECORD_VIDEO=1 pytest ...
+    Videos are written to a per-xdist-worker directory to avoid collisions.
+    """
+    args = {
         **browser_context_args,
+        "base_url": BASE_URL,
         "viewport": {"width": 1920, "height": 1080},
         "ignore_https_errors": True,
     }
+    if os.environ.get("PW_RECORD_VIDEO"):
+        args["record_video_dir"] = f"test-results/videos/{worker_id}"
+    return args
+
+
+# Requests to any other host (analytics beacons such as
+# events.backtrace.io) are aborted wholesale - nothing in the suite
+# depends on third-party responses
+_APP_HOST = urlsplit(BASE_URL).hostname
+
+
+def _apply_timeouts(context: BrowserContext) -> None:
+    """
+    Apply the suite's timeouts to the given context.
+
+    Actions and assertions settle well under DEFAULT_TIMEOUT on
+    saucedemo; the Playwright default of 30s only delays diagnosis of
+    real failures. Navigations (page.goto, wait_for_url) keep the
+    generous NAVIGATION_TIMEOUT for slow CI networks and the
+    performance_glitch_user - set_default_timeout alone would bound
+    them too.
+    """
+    context.set_default_timeout(DEFAULT_TIMEOUT)
+    context.set_default_navigation_timeout(NAVIGATION_TIMEOUT)
+
+
+def _block_static_assets(context: BrowserContext) -> None:
+    """
+    Abort image, font and third-party requests on the given context.
+
+    The suite only asserts on text, counts and URLs, so product images,
+    icon fonts and analytics calls are pure download/parse overhead on
+    every navigation. CSS is deliberately kept: visibility checks depend
+    on it.
+    """
+    context.route(
+        "**/*",
+        lambda route: route.continue_()
+        if urlsplit(route.request.url).hostname == _APP_HOST
+        else route.abort(),
+    )
+    # Registered second so it takes precedence for matching asset URLs
+    context.route(
+        "**/*.{png,jpg,jpeg,webp,svg,woff,woff2,ttf}", lambda route: route.abort()
+    )
+
+
+@pytest.fixture(scope="class")
+def context(browser: Browser, browser_context_args: dict) -> BrowserContext:
+    """
+    Unauthenticated BrowserContext shared by all tests in a class.
+
+    The browser fixture is launched once per session and this context
+    once per class, so tests only pay for a new page; the page fixture
+    clears cookies between tests so no session leaks across them.
+
+    Images, fonts and third-party requests are blocked by default since
+    nothing in the suite depends on them; set PW_LOAD_ASSETS=1 for
+    headed/visual runs that should render the real page.
+    """
+    context = browser.new_context(**browser_context_args)
+    _apply_timeouts(context)
+    if not os.environ.get("PW_LOAD_ASSETS"):
+        _block_static_assets(context)
+    yield context
+    context.close()
+
+
+@pytest.fixture(scope="function")
+def page(context: BrowserContext) -> Page:
+    """Fresh page per test in the class-shared context, cookies cleared."""
+    context.clear_cookies()
+    page = context.new_page()
+    yield page
+    page.close()
 
 
 @pytest.fixture(scope="function")
 def login_page(page: Page) -> LoginPage:
     """Navigate to login page and return LoginPage instance."""
-    login_page = LoginPage(page)
+    login_page = LoginPage.for_page(page)
     login_page.goto()
     return login_page
 
@@ -35,18 +141,128 @@ def logged_in_page(login_page: LoginPage) -> Page:
     Use this fixture when your test needs to start from the inventory page.
     """
     login_page.login(STANDARD_USER, STANDARD_PASSWORD)
-    # Wait for navigation to inventory page
-    expect(login_page.page).to_have_url(f"{BASE_URL_NO_SLASH}/inventory.html")
-    # Wait for inventory page to be fully loaded
-    inventory_page = InventoryPage(login_page.page)
-    inventory_page.is_loaded()
+    # Wait for navigation to inventory page and for the product list to
+    # render; this replaces the expect() poll plus a discarded is_loaded()
+    # round-trip with two targeted waits
+    login_page.page.wait_for_url(
+        f"{BASE_URL_NO_SLASH}/inventory.html", wait_until="domcontentloaded"
+    )
+    login_page.page.wait_for_selector(".inventory_item", state="visible", timeout=5000)
     return login_page.page
 
 
+@pytest.fixture(scope="session")
+def auth_state_path(
+    browser: Browser, browser_context_args: dict, tmp_path_factory, worker_id: str
+) -> str:
+    """
+    Log in once per session and capture the storage state for reuse.
+
+    SauceDemo keeps its session in cookies, so restoring this state into a
+    fresh context is equivalent to logging in - without the page load,
+    form fill and submit that a UI login costs on every test.
+
+    Under pytest-xdist each worker process builds its own state file
+    (named after its worker_id) with its own browser, so workers never
+    share or clobber each other's state.
+    """
+    context = browser.new_context(**browser_context_args)
+    page = context.new_page()
+    login_page = LoginPage.for_page(page)
+    login_page.goto()
+    login_page.login(STANDARD_USER, STANDARD_PASSWORD)
+    page.wait_for_url(f"{BASE_URL_NO_SLASH}/inventory.html", wait_until="domcontentloaded")
+    state_path = tmp_path_factory.mktemp("auth") / f"state-{worker_id}.json"
+    context.storage_state(path=str(state_path))
+    context.close()
+    return str(state_path)
+
+
+@pytest.fixture(scope="class")
+def auth_context(
+    browser: Browser, browser_context_args: dict, auth_state_path: str
+) -> BrowserContext:
+    """
+    Pre-authenticated context shared by all tests in a class.
+
+    Context creation is not free, and with cookies re-applied and cart
+    localStorage cleared per test (see inventory_page) one context per
+    class gives the same isolation at a fraction of the setup cost.
+    """
+    context = browser.new_context(**browser_context_args, storage_state=auth_state_path)
+    _apply_timeouts(context)
+    if not os.environ.get("PW_LOAD_ASSETS"):
+        _block_static_assets(context)
+    yield context
+    context.close()
+
+
 @pytest.fixture(scope="function")
-def inventory_page(logged_in_page: Page) -> InventoryPage:
+def inventory_page(auth_context: BrowserContext, auth_state_path: str) -> InventoryPage:
     """
-    Return InventoryPage instance after logging in.
+    Return InventoryPage instance for an already-authenticated page.
     Use this fixture when your test needs to interact with inventory page.
+
+    Restores the session-scoped storage state instead of driving the login
+    UI; tests that exercise login itself should use login_page instead.
+    Each test gets its own page in the class-scoped context, with auth
+    cookies re-applied up front (idempotent, and protects against an
+    earlier test in the class having logged out) and cart state cleared
+    at teardown.
+    """
+    with open(auth_state_path) as f:
+        auth_context.add_cookies(json.load(f)["cookies"])
+    page = auth_context.new_page()
+    page.goto(f"{BASE_URL_NO_SLASH}/inventory.html")
+    page.wait_for_selector(".inventory_item", state="visible", timeout=5000)
+    yield InventoryPage.for_page(page)
+    # Clear cart state so the next test in the shared context starts clean;
+    # the page may already be closed by the test itself
+    try:
+        page.evaluate("localStorage.removeItem('cart-contents')")
+    except Exception:
+        pass
+    page.close()
+
+
+@pytest.fixture(scope="function")
+def checkout_step_one(request, inventory_page: InventoryPage, test_data: dict) -> CheckoutPage:
+    """
+    Drive the cart into checkout step one and return the CheckoutPage.
+
+    Seeds one product and jumps straight to /checkout-step-one.html -
+    the cart-to-checkout click navigation is covered by the cart suite
+    and the end-to-end flow test, so consumers here skip it entirely.
+    Parametrize indirectly with a key from test_data['products'] to
+    choose the seeded item (defaults to the backpack):
+
+        @pytest.mark.parametrize("checkout_step_one", ["onesie"], indirect=True)
+    """
+    product_key = getattr(request, "param", "backpack")
+    inventory_page.seed_cart([test_data["products"][product_key]])
+    checkout_page = CheckoutPage.for_page(inventory_page.page)
+    checkout_page.goto_step_one()
+    return checkout_page
+
+
+@pytest.fixture(scope="class")
+def inventory_page_readonly(
+    browser: Browser, browser_context_args: dict, auth_state_path: str
+) -> InventoryPage:
+    """
+    Class-scoped inventory page shared by read-only tests.
+
+    One authenticated context and page serve every test in the class that
+    requests this fixture - use it only for tests that do not mutate cart
+    state. --dist loadfile keeps a file's tests on a single xdist worker,
+    so the shared page is never touched concurrently.
     """
-    return InventoryPage(logged_in_page)
+    context = browser.new_context(**browser_context_args, storage_state=auth_state_path)
+    _apply_timeouts(context)
+    if not os.environ.get("PW_LOAD_ASSETS"):
+        _block_static_assets(context)
+    page = context.new_page()
+    page.goto(f"{BASE_URL_NO_SLASH}/inventory.html")
+    page.wait_for_selector(".inventory_item", state="visible", timeout=5000)
+    yield InventoryPage.for_page(page)
+    context.close()
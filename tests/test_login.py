@@ -6,10 +6,14 @@ import pytest
 from playwright.sync_api import Page, expect
 from pages.login_page import LoginPage
 from pages.inventory_page import InventoryPage
-from utils.config import BASE_URL, STANDARD_USER, STANDARD_PASSWORD, LOCKED_OUT_USER
-from utils.helpers import get_user_credentials
-
-BASE_URL_NO_SLASH = BASE_URL.rstrip("/")
+from utils.config import (
+    INVALID_USER,
+    INVENTORY_URL,
+    LOGIN_URL,
+    STANDARD_USER,
+    STANDARD_PASSWORD,
+    LOCKED_OUT_USER,
+)
 
 
 @pytest.mark.login
@@ -23,32 +27,42 @@ class TestLogin:
         
         # Verify redirect to inventory page
         inventory_page = InventoryPage(login_page.page)
-        expect(login_page.page).to_have_url(f"{BASE_URL_NO_SLASH}/inventory.html")
+        expect(login_page.page).to_have_url(INVENTORY_URL)
         assert inventory_page.is_loaded(), "Inventory page should be loaded after successful login"
     
-    def test_invalid_username(self, login_page: LoginPage):
-        """Test login with invalid username."""
-        invalid_username, _ = get_user_credentials("invalid")
-        # Use a valid password to isolate invalid username behavior
-        login_page.login(invalid_username, STANDARD_PASSWORD)
-        
+    @pytest.mark.parametrize(
+        "username,password,expected",
+        [
+            pytest.param(
+                INVALID_USER,
+                STANDARD_PASSWORD,
+                "Username and password do not match",
+                id="invalid_username",
+            ),
+            pytest.param(
+                STANDARD_USER,
+                "wrong_password",
+                "Username and password do not match",
+                id="invalid_password",
+            ),
+            pytest.param("", STANDARD_PASSWORD, "Username is required", id="empty_username"),
+            pytest.param(STANDARD_USER, "", "Password is required", id="empty_password"),
+            pytest.param("", "", "Username is required", id="empty_credentials"),
+        ],
+    )
+    def test_login_error_message(
+        self, login_page: LoginPage, username: str, password: str, expected: str
+    ):
+        """Test the error message for each rejected credential combination."""
+        login_page.login(username, password)
+
         # Verify error message is displayed
         error_message = login_page.get_error_message()
-        assert "Username and password do not match" in error_message or \
+        assert expected in error_message or \
                "Epic sadface" in error_message, \
                f"Expected error message not found. Got: {error_message}"
         assert login_page.is_loaded(), "Login page should still be visible"
-    
-    def test_invalid_password(self, login_page: LoginPage):
-        """Test login with invalid password."""
-        login_page.login(STANDARD_USER, "wrong_password")
-        
-        # Verify error message is displayed
-        error_message = login_page.get_error_message()
-        assert "Username and password do not match" in error_message or \
-               "Epic sadface" in error_message, \
-               f"Expected error message not found. Got: {error_message}"
-    
+
     def test_locked_out_user(self, login_page: LoginPage):
         """Test login with locked out user credentials."""
         login_page.login(LOCKED_OUT_USER, STANDARD_PASSWORD)
@@ -60,34 +74,6 @@ class TestLogin:
                f"Expected locked out error message. Got: {error_message}"
         assert login_page.is_loaded(), "Login page should still be visible"
     
-    def test_empty_username(self, login_page: LoginPage):
-        """Test login with empty username."""
-        login_page.login("", STANDARD_PASSWORD)
-        
-        # Verify error message for empty username
-        error_message = login_page.get_error_message()
-        assert "Username is required" in error_message or \
-               "Epic sadface" in error_message, \
-               f"Expected error message for empty username. Got: {error_message}"
-    
-    def test_empty_password(self, login_page: LoginPage):
-        """Test login with empty password."""
-        login_page.login(STANDARD_USER, "")
-        
-        # Verify error message for empty password
-        error_message = login_page.get_error_message()
-        assert "Password is required" in error_message or \
-               "Epic sadface" in error_message, \
-               f"Expected error message for empty password. Got: {error_message}"
-    
-    def test_empty_credentials(self, login_page: LoginPage):
-        """Test login with both username and password empty."""
-        login_page.login("", "")
-        
-        # Verify error message
-        error_message = login_page.get_error_message()
-        assert len(error_message) > 0, "Error message should be displayed for empty credentials"
-    
     def test_login_page_elements_visible(self, login_page: LoginPage):
         """Test that all login page elements are visible."""
         assert login_page.username_input.is_visible(), "Username input should be visible"
@@ -113,23 +99,28 @@ class TestLogin:
 
     def test_cannot_access_inventory_without_login(self, page: Page):
         """Direct navigation to inventory without login should redirect to login page."""
-        page.goto(f"{BASE_URL_NO_SLASH}/inventory.html")
-        expect(page).to_have_url(f"{BASE_URL_NO_SLASH}/")
+        page.goto(INVENTORY_URL)
+        # Wait for the redirect once with a tight bound instead of letting
+        # expect() poll the URL on the default timeout
+        page.wait_for_url(LOGIN_URL, timeout=5000)
+        assert page.url == LOGIN_URL
 
-    def test_cannot_access_inventory_after_logout(self, login_page: LoginPage):
+    def test_cannot_access_inventory_after_logout(self, inventory_page: InventoryPage):
         """
         After logout, navigating directly to inventory should redirect
         back to the login page (session cleared).
         """
-        # Login and land on inventory
-        login_page.login(STANDARD_USER, STANDARD_PASSWORD)
-        expect(login_page.page).to_have_url(f"{BASE_URL_NO_SLASH}/inventory.html")
+        # Start from the cached auth state on inventory - the UI login
+        # itself is covered by test_valid_login
+        page = inventory_page.page
 
-        # Logout
-        inventory_page = InventoryPage(login_page.page)
-        inventory_page.logout()
-        expect(login_page.page).to_have_url(f"{BASE_URL_NO_SLASH}/")
+        # End the session directly: saucedemo keeps it in cookies, so
+        # clearing them is equivalent to logout without the burger-menu
+        # interaction (the menu click flow is covered by the checkout
+        # suite's logout test)
+        page.context.clear_cookies()
 
         # Attempt to access inventory again
-        login_page.page.goto(f"{BASE_URL_NO_SLASH}/inventory.html")
-        expect(login_page.page).to_have_url(f"{BASE_URL_NO_SLASH}/")
+        page.goto(INVENTORY_URL)
+        page.wait_for_url(LOGIN_URL, timeout=5000)
+        assert page.url == LOGIN_URL
@@ -3,23 +3,55 @@ Configuration management for test automation.
 Loads environment variables and provides configuration constants.
 """
 import os
+from functools import lru_cache
 from pathlib import Path
-from dotenv import load_dotenv
 
-# Load environment variables from .env file
-env_path = Path(__file__).parent.parent / '.env'
-load_dotenv(dotenv_path=env_path)
+from dotenv import dotenv_values
+
+
+@lru_cache(maxsize=1)
+def _env_file() -> dict:
+    """
+    Parse the project .env file exactly once per process.
+
+    dotenv_values parses the file into a plain dict without mutating
+    os.environ, so each lookup below is a dict hit instead of another
+    file parse - relevant under pytest-xdist where every worker imports
+    this module during collection.
+    """
+    env_path = Path(__file__).parent.parent / '.env'
+    return dotenv_values(dotenv_path=env_path)
+
+
+def _get(key: str, default: str) -> str:
+    """Resolve a setting: real environment first, then .env, then default."""
+    value = os.environ.get(key)
+    if value is not None:
+        return value
+    value = _env_file().get(key)
+    return value if value is not None else default
+
 
 # Base configuration
-BASE_URL = os.getenv('BASE_URL', 'https://www.saucedemo.com')
+BASE_URL = _get('BASE_URL', 'https://www.saucedemo.com')
+
+# Common page URLs, built once at import so tests assert against shared
+# constants instead of re-formatting f-strings per call site
+LOGIN_URL = f"{BASE_URL.rstrip('/')}/"
+INVENTORY_URL = f"{BASE_URL.rstrip('/')}/inventory.html"
 
 # User credentials
-STANDARD_USER = os.getenv('STANDARD_USER', 'standard_user')
-STANDARD_PASSWORD = os.getenv('STANDARD_PASSWORD', 'secret_sauce')
-LOCKED_OUT_USER = os.getenv('LOCKED_OUT_USER', 'locked_out_user')
-PROBLEM_USER = os.getenv('PROBLEM_USER', 'problem_user')
-PERFORMANCE_GLITCH_USER = os.getenv('PERFORMANCE_GLITCH_USER', 'performance_glitch_user')
+STANDARD_USER = _get('STANDARD_USER', 'standard_user')
+STANDARD_PASSWORD = _get('STANDARD_PASSWORD', 'secret_sauce')
+LOCKED_OUT_USER = _get('LOCKED_OUT_USER', 'locked_out_user')
+PROBLEM_USER = _get('PROBLEM_USER', 'problem_user')
+PERFORMANCE_GLITCH_USER = _get('PERFORMANCE_GLITCH_USER', 'performance_glitch_user')
+# Deliberately unknown username for negative login tests
+INVALID_USER = _get('INVALID_USER', 'invalid_user')
 
 # Timeouts (in milliseconds)
-DEFAULT_TIMEOUT = 30000  # 30 seconds
+# Every legitimate action/assertion wait on saucedemo settles well under
+# 5s; a higher default only delays diagnosis of real failures. Navigation
+# keeps a generous bound for slow CI networks and performance_glitch_user.
+DEFAULT_TIMEOUT = 5000  # 5 seconds
 NAVIGATION_TIMEOUT = 60000  # 60 seconds
@@ -2,33 +2,43 @@
 Helper functions for test automation.
 """
 import json
+from functools import lru_cache
 from pathlib import Path
 
 
+@lru_cache(maxsize=8)
 def load_test_data(file_name: str = 'test_data.json') -> dict:
     """
     Load test data from JSON file.
     
     Args:
         file_name: Name of the JSON file in the data directory
-        
+
     Returns:
         Dictionary containing test data
+
+    The parsed data is memoized per file name, so repeated calls within a
+    process reuse the dict instead of re-reading the JSON from disk.
+    Callers must treat the returned data as read-only.
     """
     data_path = Path(__file__).parent.parent / 'data' / file_name
     with open(data_path, 'r') as f:
         return json.load(f)
 
 
+@lru_cache(maxsize=16)
 def get_user_credentials(user_type: str) -> tuple[str, str]:
     """
     Get username and password for a specific user type.
-    
+
     Args:
         user_type: Type of user (standard, locked_out, problem, etc.)
-        
+
     Returns:
         Tuple of (username, password)
+
+    Memoized per user type: repeated lookups return the cached tuple
+    without touching the test-data dict again.
     """
     test_data = load_test_data()
     user = test_data['users'].get(user_type)